@@ -1,16 +1,26 @@
 import pygame
 import requests
+from requests.adapters import HTTPAdapter
 from plexapi.myplex import MyPlexAccount
 from plexapi.server import PlexServer
 import time
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import io
 import json
+import xml.etree.ElementTree as ElementTree
 from PIL import Image, ImageOps
 from datetime import datetime, timedelta
 import pygetwindow as gw
 import os
 import ctypes
 
+try:
+    import simplejpeg  # Faster libjpeg-turbo decoder, used for JPEG images when installed
+except (ImportError, ValueError):  # ValueError: built against an incompatible numpy
+    simplejpeg = None
+
 # Load Windows API functions from user32.dll
 user32 = ctypes.WinDLL('user32', use_last_error=True)
 
@@ -27,6 +37,16 @@ config = load_config()
 PLEX_URL = config['PLEX_URL']
 PLEX_TOKEN = config['PLEX_TOKEN']
 
+# Shared HTTP session so image downloads reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({'X-Plex-Token': PLEX_TOKEN})
+adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+SESSION.mount('http://', adapter)
+SESSION.mount('https://', adapter)
+
+# Worker threads that download images while the current item is on screen
+executor = ThreadPoolExecutor(max_workers=4)
+
 # Plex API Setup
 plex = PlexServer(PLEX_URL, PLEX_TOKEN)
 
@@ -39,49 +59,104 @@ clock = pygame.time.Clock()
 # Font setup
 font = pygame.font.SysFont('Arial', 25)
 title_font = pygame.font.SysFont('Arial', 30, bold=True)
+large_font = pygame.font.SysFont('Arial', 80)  # Used for the clock
+
+# Fonts by key, so rendered text can be cached by (font_key, text, color)
+FONTS = {
+    'text': font,
+    'large': large_font,
+}
+
+# Semi-transparent black overlay drawn over the fanart for readability, built once
+OVERLAY = pygame.Surface((800, 480)).convert()  # Display pixel format, no per-pixel alpha
+OVERLAY.fill((0, 0, 0))
+OVERLAY.set_alpha(128)  # Half transparent (0 = fully transparent, 255 = fully opaque)
 
 # Time to display each screen in seconds
 DISPLAY_TIME = config['DISPLAY_TIME']  # Load from config
 
+# Seconds between session polls when no notification has arrived from Plex
+POLL_INTERVAL = 30
+
+# Set by the Plex notification listener when a playback session changes state; sessions are re-read next pass
+refresh_needed = threading.Event()
+# Set when a session starts or stops, which also cuts the current rotation short
+interrupt_rotation = threading.Event()
+session_states = {}  # Last known state per session key
+
+def ttl_cache(seconds):
+    """
+    Decorator that caches a function's result per set of arguments for the given number of seconds.
+    The wrapped function gets a cache_clear() method to drop cached results early.
+    """
+    def decorator(func):
+        cache = {}
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is not None and now - entry[0] < seconds:
+                return entry[1]
+            result = func(*args)
+            cache[args] = (now, result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def plex_get_xml(path, params=None):
+    """
+    Fetches a Plex API endpoint through the shared session and returns the parsed XML root element.
+    """
+    response = SESSION.get(PLEX_URL.rstrip('/') + path, params=params, timeout=(3, 10))
+    response.raise_for_status()
+    return ElementTree.fromstring(response.content)
+
+
 def get_currently_playing():
     """
     Fetches currently playing media on Plex.
     Returns a list of currently playing items, with relevant metadata, including fanart, direct play/transcoding status, and estimated end time.
+    Reads /status/sessions in a single request instead of going through plexapi's session objects.
     """
     now_playing = []
-    for session in plex.sessions():
+    for session in plex_get_xml('/status/sessions'):
         # Initialize poster and fanart URLs based on whether it's a movie or TV show
-        if session.type == 'episode':
-            fanart_url = session.grandparentArt or session.parentArt or session.artUrl
-            poster_url = session.grandparentThumb or session.thumb
-            description = session.grandparentTitle + ": " + session.summary
+        if session.get('type') == 'episode':
+            fanart_url = session.get('grandparentArt') or session.get('parentArt') or session.get('art')
+            poster_url = session.get('grandparentThumb') or session.get('thumb')
+            description = session.get('grandparentTitle', '') + ": " + session.get('summary', '')
         else:
-            fanart_url = session.artUrl or session.thumbUrl
-            poster_url = session.thumbUrl
-            description = session.summary
+            fanart_url = session.get('art') or session.get('thumb')
+            poster_url = session.get('thumb')
+            description = session.get('summary')
 
         # Calculate estimated end time
-        current_position = session.viewOffset / 1000  # Convert milliseconds to seconds
-        duration = session.duration / 1000  # Convert milliseconds to seconds
+        current_position = int(session.get('viewOffset', 0)) / 1000  # Convert milliseconds to seconds
+        duration = int(session.get('duration', 0)) / 1000  # Convert milliseconds to seconds
         time_remaining = duration - current_position
         estimated_end_time = datetime.now() + timedelta(seconds=time_remaining)
         estimated_end_time_str = estimated_end_time.strftime('%H:%M:%S')
 
         # Fetch user data
-        if hasattr(session, 'usernames') and session.usernames:
-            user = session.usernames[0]  # Get the first username from the list
+        user_element = session.find('User')
+        if user_element is not None and user_element.get('title'):
+            user = user_element.get('title')
         else:
             user = 'Unknown User'  # Fallback in case no username is available
 
         # Determine if the session is transcoding or direct play
-        play_status = 'Transcoding' if session.transcodeSessions else 'Direct Play'
+        play_status = 'Transcoding' if session.find('TranscodeSession') is not None else 'Direct Play'
 
-        # Transcode the fanart and poster images
+        # Transcode the fanart and poster images (plexapi only builds the URLs here, no request is made)
         transcode_fanart_url = plex.transcodeImage(fanart_url, height=480, width=800)
         transcode_poster_url = plex.transcodeImage(poster_url, height=300, width=200)
 
         now_playing.append({
-            'title': session.title,
+            'title': session.get('title'),
             'user': user,  # User who is playing the media
             'transcode': play_status,  # Play status: Transcoding or Direct Play
             'poster_url': transcode_poster_url,
@@ -94,10 +169,12 @@ def get_currently_playing():
     return now_playing
 
 
+@ttl_cache(300)
 def get_last_added():
     """
     Fetches the last X movies or TV shows added to Plex, where X is from the config.
     Returns relevant metadata, ensuring we get the show or movie description, and background fanart. 
+    Results are cached for 5 minutes and dropped early when the playing sessions change.
     """
     recently_added = []
     num_items = config['NUM_RECENT_ITEMS']  # Load number of items to display from config
@@ -114,15 +191,15 @@ def get_last_added():
         # Initialize title and description
         if item.type == 'season' or item.type == 'show':
             try:
-                # Fetch the parent show metadata using parentRatingKey for the season or show
-                show = plex.fetchItem(item.parentRatingKey if item.type == 'season' else item.ratingKey)
+                # Shows already carry their metadata; seasons need their parent show fetched
+                show = plex.fetchItem(item.parentRatingKey) if item.type == 'season' else item
                 title = show.title  # The show title
                 description = show.summary  # The show description
                 fanart_url = show.artUrl  # Fetch the show's fanart
 
-                # Fetch the number of seasons and episodes
-                num_seasons = len(show.seasons())
-                num_episodes = sum(len(season.episodes()) for season in show.seasons())
+                # Number of seasons and episodes, read from the show metadata without extra requests
+                num_seasons = show.childCount
+                num_episodes = show.leafCount
 
                 print(f"Fetched Show Title: {title}")
                 print(f"Fetched Show Summary: {description}")
@@ -168,60 +245,121 @@ def get_last_added():
 
 
 
-def fetch_poster(url):
+def _decode_image(response, size):
     """
-    Fetches the poster image from a given URL.
-    Returns a Pygame image surface.
+    Decodes a downloaded image into a Pygame surface of exactly size (width, height).
+    JPEGs go through simplejpeg when it is available; everything else falls back to PIL.
+    Plex normally transcodes to the requested size already, so resizing only happens as a fallback.
     """
-    response = requests.get(url, headers={'X-Plex-Token': PLEX_TOKEN})
-    if response.status_code == 200:
-        image_data = response.content
-        image = Image.open(io.BytesIO(image_data))
+    content_type = response.headers.get('Content-Type', '')
+    if simplejpeg is not None and content_type.startswith('image/jpeg'):
+        # Let libjpeg-turbo downscale while decoding, keeping at least the target size
+        arr = simplejpeg.decode_jpeg(response.content, colorspace='RGB', min_width=size[0], min_height=size[1])
+        if (arr.shape[1], arr.shape[0]) == size:
+            return pygame.image.frombuffer(arr.data, size, 'RGB')
+        image = Image.fromarray(arr)
+    else:
+        image = Image.open(io.BytesIO(response.content))
+        image.draft('RGB', size)  # Decode oversized JPEGs at a reduced scale (no-op for other formats)
+        image = image.convert('RGB')
 
-        # Resize with LANCZOS filter for better quality
-        image = image.resize((400, 600), Image.LANCZOS)
+    if image.size != size:
+        # Crop to the target aspect ratio and resize in a single pass
+        image = ImageOps.fit(image, size, Image.BILINEAR)
 
-        return pygame.image.fromstring(image.tobytes(), image.size, image.mode)
-    return None
+    return pygame.image.fromstring(image.tobytes(), image.size, 'RGB')
 
 
-def display_info(media_item):
+@functools.lru_cache(maxsize=64)
+def _fetch_and_scale(url, width, height):
+    """
+    Downloads and decodes the image at the given URL at width x height.
+    Results are cached by (url, width, height) so repeat shows are a pure blit.
+    Raises on failure so that missing images are not cached.
+    """
+    response = SESSION.get(url, timeout=(3, 10))
+    response.raise_for_status()
+
+    surface = _decode_image(response, (width, height))
+    return surface.convert()  # Match the display pixel format for fast blits
+
+
+def fetch_poster(url, size):
+    """
+    Fetches the image from a given URL, scaled to size (width, height).
+    Returns a Pygame image surface, or None if the image cannot be loaded.
+    """
+    try:
+        return _fetch_and_scale(url, *size)
+    except (requests.RequestException, OSError, ValueError) as e:
+        print(f"Error fetching image {url}: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def render_cached(font_key, text, color):
+    """
+    Renders text with the font registered under font_key in FONTS.
+    Results are cached, so strings that rarely change are only rasterized once.
+    """
+    return FONTS[font_key].render(text, True, color).convert_alpha()
+
+
+@functools.lru_cache(maxsize=64)
+def make_title_surface(title, shadow_offset=2):
+    """
+    Renders a title in white over a black drop shadow offset by shadow_offset pixels.
+    The two are composited once per title so displaying it is a single blit.
+    """
+    title_text = title_font.render(title, True, (255, 255, 255))
+    title_shadow = title_font.render(title, True, (0, 0, 0))  # Black shadow
+
+    width, height = title_text.get_size()
+    surface = pygame.Surface((width + shadow_offset, height + shadow_offset), pygame.SRCALPHA)
+    surface.blit(title_shadow, (shadow_offset, shadow_offset))
+    surface.blit(title_text, (0, 0))
+    return surface.convert_alpha()
+
+
+def prepare_surfaces(media_item):
+    """
+    Starts downloading the fanart and poster for a media item in the background.
+    Returns a (fanart, poster) pair of futures that resolve to Pygame surfaces.
+    """
+    fanart_future = executor.submit(fetch_poster, media_item['fanart_url'], (800, 480))
+    poster_future = executor.submit(fetch_poster, media_item['poster_url'], (200, 300))
+    return fanart_future, poster_future
+
+
+def display_info(media_item, surfaces=None):
     """
     Display information about a media item on the screen, including fanart as the background.
     If the item is currently playing, display user and play status (Transcoding or Direct Play).
     Also, display season and episode count for TV shows.
+    surfaces is the pair of futures from prepare_surfaces; images are fetched now if omitted.
     """
-    screen.fill((0, 0, 0))  # Clear screen
+    if surfaces is None:
+        surfaces = prepare_surfaces(media_item)
+    fanart_future, poster_future = surfaces
 
-    # Fetch fanart image for background
-    fanart = fetch_poster(media_item['fanart_url'])  # Reuse fetch_poster to load fanart
+    # Wait for the fanart image for background
+    fanart = fanart_future.result()
     if fanart:
-        fanart = pygame.transform.scale(fanart, (800, 480))  # Scale fanart to fill the screen
         screen.blit(fanart, (0, 0))  # Display the fanart as the background
     else:
         screen.fill((0, 0, 0))  # Fill the screen with a black background if fanart cannot be loaded
 
-    # Draw a semi-transparent black rectangle overlay for readability
-    overlay = pygame.Surface((800, 480))  # Create an overlay surface
-    overlay.set_alpha(128)  # Set transparency (0 = fully transparent, 255 = fully opaque)
-    overlay.fill((0, 0, 0))  # Fill overlay with black color
-    screen.blit(overlay, (0, 0))  # Draw overlay on top of the fanart or fallback background
+    # Draw the semi-transparent black overlay for readability
+    screen.blit(OVERLAY, (0, 0))  # Draw overlay on top of the fanart or fallback background
 
-    # Fetch poster image
-    poster = fetch_poster(media_item['poster_url'])
+    # Wait for the poster image
+    poster = poster_future.result()
     if poster:
-        # Resize the poster using a higher-quality resampling filter (LANCZOS)
-        poster = pygame.transform.scale(poster, (200, 300))
         screen.blit(poster, (50, 90))  # Position the poster on the screen
 
 
     # Display title text with shadow for better readability
-    shadow_offset = 2  # Offset for shadow effect
-
-    title_text = title_font.render(media_item['title'], True, (255, 255, 255))
-    title_shadow = title_font.render(media_item['title'], True, (0, 0, 0))  # Black shadow
-    screen.blit(title_shadow, (300 + shadow_offset, 90 + shadow_offset))  # Position shadow
-    screen.blit(title_text, (300, 90))  # Position the title text
+    screen.blit(make_title_surface(media_item['title']), (300, 90))  # Position the title text
 
     # Ensure the description is not None
     description = media_item.get('description', "No description available") or "No description available"
@@ -232,15 +370,15 @@ def display_info(media_item):
 
     y_position = 140
     for line in description_lines:
-        description_text = font.render(line, True, (255, 255, 255))
+        description_text = render_cached('text', line, (255, 255, 255))
         screen.blit(description_text, (300, y_position))
         y_position += 30
 
     # Display season and episode count if it's a TV show or season
     if media_item.get('type') in ['show', 'season']:
         # Display the number of Seasons and Episodes
-        seasons_text = font.render(f"Seasons: {media_item.get('seasons', 'Unknown')}", True, (255, 255, 255))
-        episodes_text = font.render(f"Episodes: {media_item.get('episodes', 'Unknown')}", True, (255, 255, 255))
+        seasons_text = render_cached('text', f"Seasons: {media_item.get('seasons', 'Unknown')}", (255, 255, 255))
+        episodes_text = render_cached('text', f"Episodes: {media_item.get('episodes', 'Unknown')}", (255, 255, 255))
 
         screen.blit(seasons_text, (300, y_position + 20))  # Position the seasons text
         screen.blit(episodes_text, (300, y_position + 50))  # Position the episodes text
@@ -250,8 +388,8 @@ def display_info(media_item):
     # Check if this media item is from the currently playing list
     if 'user' in media_item and 'transcode' in media_item:
         # Display user and play status (Transcoding or Direct Play) only if currently playing
-        user_text = font.render(f"User: {media_item.get('user', 'Unknown User')}", True, (255, 255, 255))
-        transcode_text = font.render(f"Status: {media_item.get('transcode', 'Error')}", True, (255, 255, 255))
+        user_text = render_cached('text', f"User: {media_item.get('user', 'Unknown User')}", (255, 255, 255))
+        transcode_text = render_cached('text', f"Status: {media_item.get('transcode', 'Error')}", (255, 255, 255))
 
         screen.blit(user_text, (300, y_position + 20))  # Position the user text
         screen.blit(transcode_text, (300, y_position + 50))  # Position the play status text
@@ -267,58 +405,91 @@ def wrap_text(text, font, max_width):
     """
     if not text:
         return []  # Return empty list if text is None or empty
+
+    if font.size(text)[0] < max_width:
+        return [text]  # The whole text fits on one line
     
     words = text.split(' ')
+    widths = [font.size(word + " ")[0] for word in words]  # Measure each word once, with its trailing space
     lines = []
-    current_line = ""
+    line_start = 0
+    line_width = 0
 
-    for word in words:
-        test_line = current_line + word + " "
-        if font.size(test_line)[0] < max_width:
-            current_line = test_line
-        else:
-            lines.append(current_line)
-            current_line = word + " "
+    for i, word_width in enumerate(widths):
+        if line_width + word_width >= max_width and i > line_start:
+            lines.append(' '.join(words[line_start:i]))
+            line_start = i
+            line_width = 0
+        line_width += word_width
 
-    if current_line:
-        lines.append(current_line)
+    if line_start < len(words):
+        lines.append(' '.join(words[line_start:]))
 
     return lines
 
 
-def display_time_and_info():
+@ttl_cache(300)
+def get_library_counts():
+    """
+    Returns the total number of movies and TV shows as (num_movies, num_tv_shows).
+    Asks each section for an empty page and reads its totalSize, so no item listings are downloaded;
+    cached for 5 minutes since libraries change slowly.
+    """
+    # Match titles case-insensitively, as plexapi's library.section() does
+    section_keys = {section.get('title').lower(): section.get('key') for section in plex_get_xml('/library/sections')}
+
+    def total_size(title):
+        container = plex_get_xml(f"/library/sections/{section_keys[title.lower()]}/all",
+                                 {'X-Plex-Container-Start': 0, 'X-Plex-Container-Size': 0,
+                                  'includeCollections': 0})  # Count items only, not collections
+        return int(container.get('totalSize', 0))
+
+    return total_size('Movies'), total_size('TV Shows')
+
+
+def prepare_clock_info():
+    """
+    Starts fetching the library totals and the number of playing sessions in the background.
+    Returns a (library_counts, num_currently_playing) pair of futures.
+    """
+    counts_future = executor.submit(get_library_counts)
+    playing_future = executor.submit(lambda: len(plex_get_xml('/status/sessions')))
+    return counts_future, playing_future
+
+
+def display_time_and_info(clock_info=None):
     """
     Displays the current time centered in large font and additional smaller information
     (number of movies, TV shows, and currently playing items) at the bottom.
+    clock_info is the pair of futures from prepare_clock_info; the data is fetched now if omitted.
     """
+    if clock_info is None:
+        clock_info = prepare_clock_info()
+    counts_future, playing_future = clock_info
+
     # Get the current time using the format from config.json
     current_time = datetime.now().strftime(config['TIME_FORMAT'])
     
     # Use a larger font for the time
-    large_font = pygame.font.SysFont('Arial', 80)
-    time_text = large_font.render(current_time, True, (255, 255, 255))
+    time_text = render_cached('large', current_time, (255, 255, 255))
     
     # Calculate the centered position for the time
     text_rect = time_text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
     
     # Get the total number of movies and TV shows
-    movies_section = plex.library.section('Movies')
-    tv_shows_section = plex.library.section('TV Shows')
-    
-    num_movies = len(movies_section.all())
-    num_tv_shows = len(tv_shows_section.all())
+    num_movies, num_tv_shows = counts_future.result()
     
     # Get the number of currently playing items
-    num_currently_playing = len(get_currently_playing())
+    num_currently_playing = playing_future.result()
     
     # Log the information being displayed
     print(f"Current time: {current_time}")
     print(f"Total Movies: {num_movies}, Total TV Shows: {num_tv_shows}, Currently Playing: {num_currently_playing}")
     
     # Render the smaller info text
-    movies_text = font.render(f"Total Movies: {num_movies}", True, (255, 255, 255))
-    tv_shows_text = font.render(f"Total TV Shows: {num_tv_shows}", True, (255, 255, 255))
-    currently_playing_text = font.render(f"Currently Playing: {num_currently_playing}", True, (255, 255, 255))
+    movies_text = render_cached('text', f"Total Movies: {num_movies}", (255, 255, 255))
+    tv_shows_text = render_cached('text', f"Total TV Shows: {num_tv_shows}", (255, 255, 255))
+    currently_playing_text = render_cached('text', f"Currently Playing: {num_currently_playing}", (255, 255, 255))
     
     # Clear the screen before displaying
     screen.fill((0, 0, 0))
@@ -360,36 +531,134 @@ def bring_window_to_front():
     else:
         print("No window found with the title 'Plex Now Playing'.")
 
+def on_plex_alert(data):
+    """
+    Callback for Plex websocket notifications.
+    Flags a refresh when a playback session changes state; progress updates are ignored.
+    Only sessions starting or stopping interrupt the rotation, since pausing or buffering
+    does not change what is on screen.
+    """
+    if data.get('type') != 'playing':
+        return
+    for notification in data.get('PlaySessionStateNotification', []):
+        session_key = notification.get('sessionKey')
+        state = notification.get('state')
+        if session_states.get(session_key) == state:
+            continue  # Progress update for a known session
+        started = session_key not in session_states
+        if state == 'stopped':
+            session_states.pop(session_key, None)
+        else:
+            session_states[session_key] = state
+        refresh_needed.set()
+        if started or state == 'stopped':
+            interrupt_rotation.set()
+
+
+def start_alert_listener():
+    """
+    Subscribes to Plex's notification websocket.
+    Returns the listener thread, or None if websocket-client is not installed or the listener cannot be started.
+    The main loop keeps polling every POLL_INTERVAL seconds either way, so a dropped connection only costs latency.
+    """
+    try:
+        import websocket  # noqa: F401  plexapi's listener thread silently exits without it
+    except ImportError:
+        print("websocket-client is not installed, falling back to polling Plex for sessions")
+        return None
+    try:
+        return plex.startAlertListener(callback=on_plex_alert)
+    except Exception as e:
+        print(f"Error starting Plex notification listener, falling back to polling: {e}")
+        return None
+
+
+def stop_alert_listener(listener):
+    """
+    Closes the Plex notification websocket.
+    The listener thread may have exited or not connected yet, so errors here are only logged.
+    """
+    try:
+        listener.stop()
+    except Exception as e:
+        print(f"Error stopping Plex notification listener: {e}")
+
+
+def wait_with_events(seconds):
+    """
+    Keeps the window responsive for the given number of seconds instead of sleeping.
+    Returns early when a Plex session starts or stops.
+    Returns False as soon as the user closes the window or presses Esc, True otherwise.
+    """
+    end_time = time.monotonic() + seconds
+    while time.monotonic() < end_time and not interrupt_rotation.is_set():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False  # Exit on window close
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False  # Exit on Esc key press
+        clock.tick(30)  # Poll at 30 frames per second
+    return True
+
+
 def main_loop():
     """
     Main application loop. Fetches current playing or last added media and rotates through them.
     Allows exiting the full-screen mode with a key press (e.g., Esc key).
     """
     running = True
+    last_playing_urls = set()
+    now_playing = []
+    last_poll = None
+    listener = start_alert_listener()
     while running:
         bring_window_to_front()  # Bring the window to the front if minimized or in the background
 
-        now_playing = get_currently_playing()
+        # Only ask Plex for sessions when it signalled a change, or as a periodic safety net
+        if refresh_needed.is_set() or last_poll is None or time.monotonic() - last_poll >= POLL_INTERVAL:
+            refresh_needed.clear()
+            interrupt_rotation.clear()
+            now_playing = get_currently_playing()
+            last_poll = time.monotonic()
+
+        # Drop cached images and recently added items when the set of playing artwork changes
+        playing_urls = {url for item in now_playing for url in (item['fanart_url'], item['poster_url'])}
+        if playing_urls and playing_urls != last_playing_urls:
+            _fetch_and_scale.cache_clear()
+            get_last_added.cache_clear()
+        last_playing_urls = playing_urls
         media_to_display = now_playing if now_playing else get_last_added()
 
+        # Start downloading every item's images so they are ready by the time they are shown
+        prepared = [prepare_surfaces(media_item) for media_item in media_to_display]
+
         # Iterate through media items (either currently playing or recently added)
-        for media_item in media_to_display:
-            display_info(media_item)
-            time.sleep(DISPLAY_TIME)
-
-            # Check for events (including key presses)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False  # Exit loop on window close
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False  # Exit loop on Esc key press
-
-        if config['SHOW_CLOCK'] == 1:
+        clock_info = None
+        for index, (media_item, surfaces) in enumerate(zip(media_to_display, prepared)):
+            display_info(media_item, surfaces)
+            if config['SHOW_CLOCK'] == 1 and index == len(media_to_display) - 1:
+                clock_info = prepare_clock_info()  # Fetch the clock screen data while the last item is shown
+            running = wait_with_events(DISPLAY_TIME)
+            if not running or interrupt_rotation.is_set():
+                break  # Exit, or start over with the new playback state
+
+        # Drop downloads for items that were skipped so they don't delay the next pass
+        for surfaces in prepared:
+            for future in surfaces:
+                future.cancel()  # No-op for downloads that already ran
+
+        if running and config['SHOW_CLOCK'] == 1 and not interrupt_rotation.is_set():
             # After displaying all media items, show the centered time and smaller additional info together
-            display_time_and_info()  # Display large centered time and smaller additional info simultaneously
-            time.sleep(DISPLAY_TIME)  # Keep this info on screen for the defined time
-
+            display_time_and_info(clock_info)  # Display large centered time and smaller additional info simultaneously
+            running = wait_with_events(DISPLAY_TIME)  # Keep this info on screen for the defined time
+        elif running and not media_to_display:
+            running = wait_with_events(DISPLAY_TIME)  # Nothing to show, wait before checking again
+
+    if listener:
+        stop_alert_listener(listener)  # Close the Plex notification websocket
+    executor.shutdown(wait=False, cancel_futures=True)  # Drop queued downloads before closing the session
+    SESSION.close()  # Release pooled HTTP connections
     pygame.quit()  # Clean up and close the window when exiting
 
 